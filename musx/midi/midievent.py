@@ -7,32 +7,144 @@ convert to on and off messages when written to files and ports.
 """
 
 
+import operator
 from . import midimsg as mm
 from . import gm
 from ..note import Event
 
 
+# Dispatch tables for the MidiEvent data accessors that support more than
+# one status byte, mapping each status to an itemgetter for its data byte.
+# An itemgetter runs without a Python frame.
+_data1, _data2 = operator.itemgetter(1), operator.itemgetter(2)
+_keynum_accessors = {mm.kNoteOff: _data1, mm.kNoteOn: _data1, mm.kAftertouch: _data1}
+_velocity_accessors = {mm.kNoteOff: _data2, mm.kNoteOn: _data2}
+
+def _status_predicate(status, doc):
+    """
+    Returns a MidiEvent method that tests the event's cached status
+    byte against status.
+    """
+    def predicate(self):
+        return self._status == status
+    predicate.__doc__ = doc
+    return predicate
+
+
+def _extern_renderer(entry):
+    """
+    Returns a function that renders an event as the constructor call
+    described by a MidiEvent._print_table entry.
+    """
+    name = entry[0][0]
+    getters = [getter for _, getter in entry[1:]]
+    def render(ev):
+        args = []
+        for getter in getters:
+            x = getter(ev)
+            args.append("\'" + x + "\'" if isinstance(x, str) else str(x))
+        return f"{name}({', '.join(args)})"
+    return render
+
+
+# The meta message types whose data is a text string.
+_text_meta_types = frozenset(range(mm.kText, mm.kDevName + 1))
+
+# The meta message types whose data length is a variable length quantity.
+_payload_meta_types = _text_meta_types | {mm.kSeqEvent}
+
+# Formatters that append a description of an event's data to its hint(),
+# keyed by channel status or meta type.
+_channel_hints = {
+    mm.kCtrlChange: lambda e: gm.controller_names[e.message[1]] + " ",
+    mm.kProgChange: lambda e: gm.instrument_names[e.message[1]] + " "
+}
+
+def _key_signature_hint(e):
+    # the key is stored as a twos-complement value -7...7, sign extend it.
+    key = (e.message[3] ^ 0x80) - 0x80
+    return MidiEvent._key_table[key+7] + ["-major", "-minor"][e.message[4]]
+
+_meta_hints = {
+    mm.kTempo: lambda e: str(e.tempo('bpm')) + ' bpm',
+    mm.kTimeSig: lambda e: str(e.message[3]) + "/" + str(2**e.message[4]),
+    mm.kKeySig: _key_signature_hint
+}
+
+# Channel mode messages have no variable data so the messages for
+# all 16 channels are built once and shared by the events that use them.
+_all_notes_off = tuple(mm.control_change(c, 123, 0) for c in range(16))
+_all_sound_off = tuple(mm.control_change(c, 120, 0) for c in range(16))
+_all_controllers_off = tuple(mm.control_change(c, 121, 0) for c in range(16))
+
+# System realtime messages consist of a single status byte so each event
+# shares one message instance; only the event times differ.
+_midi_clock = mm.midi_clock()
+_midi_start = mm.midi_start()
+_midi_continue = mm.midi_continue()
+_midi_stop = mm.midi_stop()
+_active_sensing = mm.active_sensing()
+_midi_reset = mm.midi_reset()
+
+
 class MidiEvent (Event):
     """
-    A class that wraps lists of midi message bytes so they can be treated 
+    A class that wraps midi message bytes so they can be treated 
     as time stamped objects. Unless you know what you are doing you should
     probably not call this constructor directly and use the class message
     constructors to create defined below.
 
     Parameters
     ----------
-    message : list
-        The list of message byte values. The constructor does not check these values!
+    message : bytes | list
+        The message byte values, see `musx.midi.midimsg`. The constructor
+        does not check these values!
     time : number
         The time to give the midi message. The units for this are application-specific.
     """
 
+    # Allows positional class patterns such as `case MidiEvent(mm.kNoteOn):`
+    __match_args__ = ('kind',)
+
+    # Midi files can hold many thousands of events, so drop the per-instance
+    # __dict__ and keep only the message and its cached status byte.
+    __slots__ = ('_message', '_status')
+
     def __init__(self, message, time=0.0):
 
         super().__init__(time)
         self.message = message
         # self.time = time
 
+    @property
+    def message(self):
+        """
+        The message byte values. Assigning a message also caches
+        the message's status byte so predicates do not have to recompute it.
+        """
+        return self._message
+
+    @message.setter
+    def message(self, message):
+        self._message = message
+        self._status = mm.status(message)
+
+    @property
+    def kind(self):
+        """
+        A stable integer identifying the kind of the event: the status byte of
+        the message with channel bits removed, e.g. mm.kNoteOn or mm.kSysEx.
+        Meta events and midi resets share the kind mm.kMetaMsg, use `is_meta()`
+        to tell them apart. Use kind to dispatch on event types in one step
+        instead of testing a series of predicates:
+        ```py
+        match ev.kind:
+            case mm.kNoteOn: ...
+            case mm.kCtrlChange: ...
+        ```
+        """
+        return self._status
+
     def __str__(self):
         """The print() string shows the raw data."""
         return self.tostring()
@@ -67,15 +179,16 @@ class MidiEvent (Event):
 
     def status(self):
         """Returns the status byte of a MidiEvent."""
-        return mm.status(self.message)
+        return self._status
 
     def channel(self):
         """
         Returns the channel of a midi channel event or -1
         if the message is not a channel event.
         """
-        if mm.is_channel_message(self.message):
-            return mm.channel(self.message)
+        # channel message status bytes are all less than kSysEx.
+        if self._status < mm.kSysEx:
+            return self.message[0] & mm.kChannelMask
         return -1
 
     @classmethod
@@ -107,7 +220,7 @@ class MidiEvent (Event):
 
     def is_note_off(self):
         """Returns true if the event is a note off."""
-        return self.status() == mm.kNoteOff
+        return self._status == mm.kNoteOff
 
     @classmethod
     def note_on(cls, channel, keynum, velocity, time=0.0):
@@ -137,29 +250,27 @@ class MidiEvent (Event):
 
     def is_note_on(self):
         """Returns true if the message is a note on."""
-        return self.status() == mm.kNoteOn
+        return self._status == mm.kNoteOn
 
     def is_note_on_or_off(self):
         """Returns true if the message is a note on or off."""
-        return mm.kNoteOff <= self.status() <= mm.kNoteOn
+        return mm.kNoteOff <= self._status <= mm.kNoteOn
 
     def keynum(self):
         """
         Returns a key number value 0 to 127, or -1 if the
         event is not a note on, off, or aftertouch.
         """
-        if self.status() in [mm.kNoteOff, mm.kNoteOn, mm.kAftertouch]:
-            return mm.keynum(self.message)
-        return -1
+        fn = _keynum_accessors.get(self._status)
+        return fn(self.message) if fn else -1
 
     def velocity(self):
         """
         Returns a velocity value 0 to 127, or -1 if the message is not
         a note on or off.
         """
-        if self.is_note_on_or_off():
-            return mm.velocity(self.message)
-        return -1
+        fn = _velocity_accessors.get(self._status)
+        return fn(self.message) if fn else -1
 
     @classmethod
     def aftertouch(cls, chan, keynum, press, time=0.0):
@@ -189,15 +300,13 @@ class MidiEvent (Event):
 
     def is_aftertouch(self):
         """Returns true if the midi event is an an aftertouch."""
-        return self.status() == mm.kAftertouch
+        return self._status == mm.kAftertouch
 
     def touch(self):
         """
         Return a pressure value 0 127, or -1 if the event is not an aftertouch.
         """
-        if self.is_aftertouch():
-            return mm.touch(self.message)
-        return -1
+        return self.message[2] if self._status == mm.kAftertouch else -1
 
     @classmethod
     def control_change(cls, chan, ctrl, val, time=0.0):
@@ -227,32 +336,28 @@ class MidiEvent (Event):
 
     def is_control_change(self):
         """Returns true if the message is a control change event."""
-        return self.status() == mm.kCtrlChange
+        return self._status == mm.kCtrlChange
 
     def controller(self):
         """
         Returns a controller value 0 to 127, or -1 if the event
         is not a control change.
         """
-        if self.is_control_change():
-            return mm.controller(self.message)
-        return -1
+        return self.message[1] if self._status == mm.kCtrlChange else -1
 
     def is_controller_of_type(self, contype):
         """
         Returns true if the event is a control change message and
         its controller is the specified type.
         """
-        return self.is_control_change() and self.controller() == contype
+        return self._status == mm.kCtrlChange and self.message[1] == contype
 
     def control(self):
         """
         Returns a control value 0 127, or -1 if the event is
         not a control change.
         """
-        if self.is_control_change():
-            return mm.control(self.message)
-        return -1
+        return self.message[2] if self._status == mm.kCtrlChange else -1
 
     @classmethod
     def program_change(cls, chan, prog, time=0.0):
@@ -279,16 +384,14 @@ class MidiEvent (Event):
 
     def is_program_change(self):
         """Returns true if the event is a program change."""
-        return self.status() == mm.kProgChange
+        return self._status == mm.kProgChange
 
     def program(self):
         """
         Returns a progam change value 0 127, or -1 if the event is
         not a program change.
         """
-        if self.status() == mm.kProgChange:
-            return mm.program(self.message)
-        return -1
+        return self.message[1] if self._status == mm.kProgChange else -1
 
     @classmethod
     def channel_pressure(cls, chan, press, time=0.0):
@@ -315,16 +418,14 @@ class MidiEvent (Event):
 
     def is_channel_pressure(self):
         """Returns true if the event is a channel pressure."""
-        return self.status() == mm.kChanPress
+        return self._status == mm.kChanPress
 
     def pressure(self):
         """
         Returns a pressure value 0 127, or -1 if the event is not
         a channel pressure.
         """
-        if self.is_channel_pressure():
-            return mm.pressure(self.message)
-        return -1
+        return self.message[1] if self._status == mm.kChanPress else -1
 
     @classmethod
     def pitch_bend(cls, chan, bend, time=0.0):
@@ -347,15 +448,13 @@ class MidiEvent (Event):
 
     def is_pitch_bend(self):
         """Returns true if the event is a pitch bend."""
-        return self.status() == mm.kPitchBend
+        return self._status == mm.kPitchBend
 
     def bend(self):
         """
         Returns a bend value 0 to 16383 or -1 if the event is not a pitch bend.
         """
-        if self.status() == mm.kPitchBend:
-            return mm.bend(self.message)
-        return -1
+        return mm.bend(self.message) if self._status == mm.kPitchBend else -1
 
     @staticmethod
     def bend_value(semibend, semirange):
@@ -389,7 +488,7 @@ class MidiEvent (Event):
         * A ValueError if the value is out of range.
         """
         chan = cls._check_int_range(chan, 16)
-        return cls(mm.control_change(chan, 123, 0), time)
+        return cls(_all_notes_off[chan], time)
 
     @classmethod
     def all_sound_off(cls, chan, time=0.0):
@@ -409,7 +508,7 @@ class MidiEvent (Event):
         * A ValueError if the value is out of range.
         """
         chan = cls._check_int_range(chan, 16)
-        return cls(mm.control_change(chan, 120, 0), time)
+        return cls(_all_sound_off[chan], time)
 
     ## Creates a midi all controllers off message.
     #  @param chan  a channel number, 0 to 15.
@@ -418,16 +517,12 @@ class MidiEvent (Event):
     @classmethod
     def all_controllers_off(cls, chan, time=0.0):
         """
-        Creates a midi note off event.
+        Creates a midi all controllers off event.
 
         Parameters
         ----------
-        channel : 0-15
+        chan : 0-15
             The channel number of the midi event.
-        keynum : byte
-            A midi key number 0 to 127.
-        velocity : byte
-            A velocity value 0 to 127.
         time : number
             The time to give the midi message. The units for this are application-specific.
 
@@ -437,7 +532,7 @@ class MidiEvent (Event):
         * A ValueError if the value is out of range.
         """
         chan = cls._check_int_range(chan, 16)
-        return cls(mm.control_change(chan, 121, 0), time)
+        return cls(_all_controllers_off[chan], time)
 
 
     # Midi Meta Messages. These are only valid in midi files.
@@ -449,17 +544,31 @@ class MidiEvent (Event):
 
         If typ is not specifed the function returns true if the event is any
         type of meta message, otherwise the event must be the specied type between
-        kDevName and kSeqEvent.
+        kDevName and kSeqEvent. When testing for a specific type it is faster
+        to call `is_meta_type()` directly.
 
         Parameters
         ----------
         typ : metatype | None
             The midi meta message type or None.
         """
-        meta = self.status() == mm.kMetaMsg and len(self.message) >= 3
-        if not meta or typ is None:
-            return meta
-        return self.message[1] == typ
+        if typ is not None:
+            return self.is_meta_type(typ)
+        # the length test distinguishes meta messages from a midi reset,
+        # which has the same status byte.
+        return self._status == mm.kMetaMsg and len(self.message) >= 3
+
+    def is_meta_type(self, typ):
+        """
+        Returns true if the event is a meta event of the specified type.
+
+        Parameters
+        ----------
+        typ : metatype
+            The midi meta message type.
+        """
+        message = self.message
+        return self._status == mm.kMetaMsg and len(message) >= 3 and message[1] == typ
 
     @classmethod
     def meta_seq_number(cls, num, time=0.0):
@@ -484,13 +593,11 @@ class MidiEvent (Event):
 
     @classmethod
     def _textmeta(cls, mtype, text, time=0.0):
-        if isinstance(mtype, int) and mm.kText <= mtype <= mm.kDevName:
-            if isinstance(text, str) and len(text) > 0:
-                return cls(mm.text_meta_message(mtype, text), time)
-            else:
-                raise TypeError(f"text value '{text}' is not a string.")
-        else:
-            raise TypeError(f"value '{text}' is not valid midi meta type.")
+        if type(mtype) is not int or not mm.kText <= mtype <= mm.kDevName:
+            raise TypeError(f"value '{mtype}' is not valid midi meta type.")
+        if type(text) is not str or not text:
+            raise TypeError(f"text value '{text}' is not a string.")
+        return cls(mm.text_meta_message(mtype, text), time)
 
     @classmethod
     def meta_text(cls, text, time=0.0):
@@ -660,9 +767,9 @@ class MidiEvent (Event):
         Returns the text string from a meta text event or
         an empty string if the event is not a text event.
         """
-        if self.is_meta():
-            if mm.kText <= self.message[1] <= mm.kDevName:
-                return mm.text(self.message)
+        message = self.message
+        if self._status == mm.kMetaMsg and len(message) >= 3 and message[1] in _text_meta_types:
+            return mm.text(message)
         return ''
 
     @classmethod
@@ -755,11 +862,13 @@ class MidiEvent (Event):
         units : 'usec' | 'bpm'
             A string indicating if the tempo should returned as microseconds or beats per minute.
         """
-        if self.is_meta(mm.kTempo):
+        if self.is_meta_type(mm.kTempo):
+            usecs = mm.tempo(self.message)
             if units == 'usec':
-                return mm.tempo(self.message)
+                return usecs
             elif units == 'bpm':
-                return int(60 * (1000000 / mm.tempo(self.message)))
+                # 60000000 is the number of microseconds in a minute.
+                return 60000000 // usecs
         return 0
 
     # HKT FIXME: 4 4 yields  
@@ -787,12 +896,12 @@ class MidiEvent (Event):
         * A TypeError if a value is not an integer.
         * A ValueError if the value is out of range.
         """
-        for x in [top, bot, clocks, tsecs]:
-            if not isinstance(x, int):
-                raise ValueError(f"parameter value {x} not an integer. ")
+        if type(top) is not int or type(bot) is not int or type(clocks) is not int or type(tsecs) is not int:
+            x = next(x for x in (top, bot, clocks, tsecs) if type(x) is not int)
+            raise ValueError(f"parameter value {x} not an integer. ")
         pow2 = [1, 2, 4, 8, 16, 32, 64, 128]
         if bot not in pow2:
-            raise ValueError(f"denominator value {x} not a power of 2. ")
+            raise ValueError(f"denominator value {bot} not a power of 2. ")
         # timesig stores bot as exponent of 2, which is the same as the
         # index of bot in list :) examp: bot of 8 is 2^3 so 3 is stored.
         bot = pow2.index(bot)
@@ -871,15 +980,16 @@ class MidiEvent (Event):
 
     def is_sysex(self):
         """Returns true if the message is a sysex event."""
-        return self.status() == mm.kSysEx
+        return self._status == mm.kSysEx
 
     def sysex_data(self):
         """
-        Returns the data list of the sysex event (without the EOE byte) or
-        an empty list if it is not a sysex event.
+        Returns the data bytes of the sysex event (without the EOE byte) or
+        an empty list if it is not a sysex event. The data is returned as a
+        memoryview on the message so large sysex dumps are not copied.
         """
-        if self.status() == mm.kSysEx:
-            return self.message[1::-1]
+        if self._status == mm.kSysEx:
+            return mm.sysex_data(self.message)
         return []
 
     @classmethod
@@ -976,11 +1086,9 @@ class MidiEvent (Event):
         time : number
             The time to give the midi message. The units for this are application-specific.
         """
-        return cls(mm.midi_clock(), time)
+        return cls(_midi_clock, time)
 
-    def is_midi_clock(self):
-        """Returns true if the event is a midi clock event."""
-        return self.status() == mm.kTimingClock
+    is_midi_clock = _status_predicate(mm.kTimingClock, "Returns true if the event is a midi clock event.")
 
     @classmethod
     def midi_start(cls, time=0.0):
@@ -992,11 +1100,9 @@ class MidiEvent (Event):
         time : number
             The time to give the midi message. The units for this are application-specific.
         """
-        return cls(mm.midi_start(), time)
+        return cls(_midi_start, time)
 
-    def is_midi_start(self):
-        """Returns true if the event is a midi start event."""
-        return self.status() == mm.kStart
+    is_midi_start = _status_predicate(mm.kStart, "Returns true if the event is a midi start event.")
 
     @classmethod
     def midi_continue(cls, time=0.0):
@@ -1008,11 +1114,9 @@ class MidiEvent (Event):
         time : number
             The time to give the midi message. The units for this are application-specific.
         """
-        return cls(mm.midi_continue(), time)
+        return cls(_midi_continue, time)
 
-    def is_midi_continue(self):
-        """Returns true if the event is a midi continue event."""
-        return self.status() == mm.kContinue
+    is_midi_continue = _status_predicate(mm.kContinue, "Returns true if the event is a midi continue event.")
 
     @classmethod
     def midi_stop(cls, time=0.0):
@@ -1024,11 +1128,9 @@ class MidiEvent (Event):
         time : number
             The time to give the midi message. The units for this are application-specific.
         """
-        return cls(mm.midi_stop(), time)
+        return cls(_midi_stop, time)
 
-    def is_midi_stop(self):
-        """Returns true if the event is a midi stop event."""
-        return self.status() == mm.kStop
+    is_midi_stop = _status_predicate(mm.kStop, "Returns true if the event is a midi stop event.")
 
     @classmethod
     def active_sensing(cls, time=0.0):
@@ -1040,11 +1142,9 @@ class MidiEvent (Event):
         time : number
             The time to give the midi message. The units for this are application-specific.
         """
-        return cls(mm.active_sensing(), time)
+        return cls(_active_sensing, time)
 
-    def is_active_sensing(self):
-        """Returns true if the event is a midi active sensing event."""
-        return self.status() == mm.kActiveSens
+    is_active_sensing = _status_predicate(mm.kActiveSens, "Returns true if the event is a midi active sensing event.")
 
     @classmethod
     def midi_reset(cls, time=0.0):
@@ -1056,48 +1156,44 @@ class MidiEvent (Event):
         time : number
             The time to give the midi message. The units for this are application-specific.
         """
-        return cls(mm.midi_reset(), time)
+        return cls(_midi_reset, time)
 
-    def is_midi_reset(self):
-        """Returns true if the event is a midi reset event."""
-        return self.status() == mm.kReset
+    is_midi_reset = _status_predicate(mm.kReset, "Returns true if the event is a midi reset event.")
 
     # Support code.
 
     def tostring(self, hint=False):
-        text = f"{self.message}"
         if hint:
-            text += " # " + self.hint()
-        return text
+            return f"{self._message_list()} # {self.hint()}"
+        return f"{self._message_list()}"
+
+    def _message_list(self):
+        # sysex, text and sequencer metas list their data length and bytes
+        # after the status (and meta type) rather than every data byte.
+        message = self.message
+        if self._status == mm.kSysEx or (self._status == mm.kMetaMsg and len(message) > 2
+                                         and message[1] in _payload_meta_types):
+            data = mm.payload(message)
+            return [*message[:1 if self._status == mm.kSysEx else 2], len(data), bytes(data)]
+        return list(message)
 
     def hint(self):
-        stat = self.status()
+        stat = self._status
         if stat < mm.kSysEx:  # channel message
-            text = self._print_table[stat][0][1] + ": "
-            if stat == mm.kCtrlChange:
-                text += (gm.controller_names[self.message[1]] + " ")
-            elif stat == mm.kProgChange:
-                text += (gm.instrument_names[self.message[1]] + " ")
-            text += "chan " + str(self.channel())
+            fn = _channel_hints.get(stat)
+            data = fn(self) if fn else ""
+            text = f"{self._print_table[stat][0][1]}: {data}chan {self.channel()}"
         elif stat == mm.kMetaMsg:  # meta or reset
             if len(self.message) > 1:  # is a meta message
                 stat = self.message[1]  # status now meta type
-                text = MidiEvent._print_table[stat][0][1] + ": "
-                if mm.kText <= stat <= mm.kDevName:
-                    msg = self.text()
-                    if len(msg) > 16:
-                        msg = msg[:16] + "..."
-                    text += msg
-                elif stat == mm.kTempo:
-                    text += str(self.tempo('bpm')) + ' bpm'
-                elif stat == mm.kTimeSig:
-                    text += str(self.message[3]) + "/" + str(2**self.message[4])
-                elif stat == mm.kKeySig:
-                    # the key is stored as a twos-complement value -7...7
-                    # key = int.from_bytes(bytes([self.message[3]]), 'big', signed=True)
-                    k = self.message[3]
-                    key = k if k < 128 else (256 - k) * (-1)
-                    text += MidiEvent._key_table[key+7] + ["-major", "-minor"][self.message[4]]
+                if stat in _text_meta_types:
+                    data = self.text()
+                    if len(data) > 16:
+                        data = data[:16] + "..."
+                else:
+                    fn = _meta_hints.get(stat)
+                    data = fn(self) if fn else ""
+                text = f"{MidiEvent._print_table[stat][0][1]}: {data}"
             else:
                 text = MidiEvent._print_table[stat][0][1]
         else:  # system common or realtime
@@ -1105,18 +1201,11 @@ class MidiEvent (Event):
         return text
 
     def toextern(self):
-        stat = self.status()
+        stat = self._status
         if stat == mm.kReset:  # NB: midi makes kReset status same as kMetaMsg
             if self.is_meta():
                 stat = self.message[1]
-        e = MidiEvent._print_table[stat]
-        s = e[0][0] + "("
-        for i in range(1, len(e)):
-            if i > 1: s += ", "
-            x = e[i][1](self)
-            s += "\'" + x + "\'" if isinstance(x, str) else str(x)
-        s += ")"
-        return s
+        return MidiEvent._extern_renderers[stat](self)
 
     _key_table = ['Cb', 'Gb', 'Db', 'Ab', 'Eb', 'Bb', 'F', 'C', 'G', 'D', 'A', 'E', 'B', 'F#', 'C#']
     _print_table = {
@@ -1162,6 +1251,9 @@ class MidiEvent (Event):
         mm.kReset: [["midi_reset", "midi reset"]],
     }
 
+    # toextern() renderers built once from the _print_table entries.
+    _extern_renderers = {stat: _extern_renderer(entry) for stat, entry in _print_table.items()}
+
 
 
 
@@ -4,7 +4,11 @@ The midifile module provide support for reading and writing midi files.
 """
 
 
+import heapq
+import itertools
+import mmap
 import os.path
+import struct
 from . import midimsg as mm
 from . import midievent as me
 from .gm import AcousticGrandPiano
@@ -13,6 +17,41 @@ from ..note import Note
 from ..tools import rescale
 
 
+# A chunk header: the 4 byte chunk type and its 32 bit length.
+_chunk_header = struct.Struct('>4sI')
+# The MThd chunk's data: level, number of tracks and signed divisions.
+_MThd = struct.Struct('>HHh')
+
+# Files at least this size are memory mapped rather than read for parsing.
+_mmap_min_size = 1 << 20
+
+# The number of data bytes in a channel message, indexed by the upper
+# nibble of its status byte: note off, note on, aftertouch, controller
+# and pitch bend have two, program change and channel pressure have one.
+_channel_data_lengths = (0, 0, 0, 0, 0, 0, 0, 0, 2, 2, 2, 2, 1, 1, 2, 0)
+
+# The meta message types the reader supports.
+_meta_types = frozenset([*range(mm.kText, mm.kDevName + 1), mm.kSeqNumber,
+                         mm.kChanPrefix, mm.kMidiPort, mm.kEOT, mm.kTempo,
+                         mm.kSMPTEOff, mm.kTimeSig, mm.kKeySig, mm.kSeqEvent])
+
+
+# Messages are bytes laid out exactly as they are in a midi file, so the
+# writers append them unchanged.
+def _write_flat_message(buf, message):
+    buf.extend(message)
+
+
+# The message writers keyed by status byte (channel bits included). Writers
+# append the message's bytes to a track's bytearray.
+_message_writers = {
+    **{status: _write_flat_message for status in range(mm.kNoteOff, mm.kSysEx)},
+    mm.kSysEx: _write_flat_message,
+    mm.kEOE: _write_flat_message,
+    mm.kMetaMsg: _write_flat_message
+}
+
+
 class MidiFile:
     """
     A class for reading and writing midi files.
@@ -25,51 +64,47 @@ class MidiFile:
     path : string
         The pathname to the midi file on disk.
     tracks : list
-        A list of one or more tracks, each track is a Seq.
+        A list of one or more tracks, each track is a Seq. Defaults
+        to no tracks.
     divs : int
         The midi file's ticks-per-quarter setting, defaults to 480.
     """
 
-    level = 0
-    """The MIDI level of the file, either 0, 1, or 2."""
-
-    divisions = 0
-    """The number of ticks per quarter note."""
-
-    tracks = []
-    """
-    The tracks of the MidiFile. Each track is a Seq. Your first track
-    (track 0 in the file) should start with a tempo message otherwise
-    the data will be performed using the musx default tempo mm=60.
-    """
-
-    pathname = ""
-    """The pathname of the MidiFile."""
+    __slots__ = ('level', 'divisions', 'tracks', 'pathname', 'format')
 
-    _running_status = 0
-
-    def __init__(self, path, tracks=[], divs=480):
+    def __init__(self, path, tracks=None, divs=480):
 
         if not isinstance(path, str) or len(path) == 0:
             raise TypeError(f"'{path}' is not a valid pathname string.")
-        if not isinstance(tracks, list):
-            tracks = [tracks]
-        else:
+        if tracks is None:
+            tracks = []
+        elif isinstance(tracks, list):
             tracks = tracks.copy() # always copy user's list
-        if any(not isinstance(t, Seq) for t in tracks):
+        else:
+            tracks = [tracks]
+        if not all(isinstance(t, Seq) for t in tracks):
             raise TypeError(f"{tracks} is not a valid list of midi tracks.")
         if not isinstance(divs, int) and divs > 0:
             raise ValueError(f"{divs} is not a valid divisions-per-quarter.")
-        self.tracks = tracks
+        self.level = 0
+        """The MIDI level of the file, either 0, 1, or 2."""
         self.divisions = divs
+        """The number of ticks per quarter note."""
+        self.tracks = tracks
+        """
+        The tracks of the MidiFile. Each track is a Seq. Your first track
+        (track 0 in the file) should start with a tempo message otherwise
+        the data will be performed using the musx default tempo mm=60.
+        """
         self.pathname = path
+        """The pathname of the MidiFile."""
+        self.format = 0
 
     def clear(self):
         """Removes all the data from the MidiFile."""
         self.level = 0
         self.divisions = 0
         self.tracks = []
-        self._running_status = 0
         self.pathname = ""
 
     @staticmethod
@@ -129,27 +164,37 @@ class MidiFile:
         """
         pathname = self.pathname
         with open(pathname, "rb") as stream:
-            self.clear()
-            self.pathname = pathname # restore the pathname after clearing!
-            length = self._read_chunk_length(stream, b'MThd')
-            assert length == 6, "MThd chunk length 6 not found."
-            self.level = self._bytes_to_int(stream.read(2))
-            tracks = self._bytes_to_int(stream.read(2))
-            # read divisions as a two byte signed quantity. if its positive
-            # then it represents ticks per quarter. if its negative then its
-            # smpte format where the upper byte contains -24, -25 or -30,
-            # and the lower byte is positive subframes. Example: millisecond
-            # smpte timing would be 0xE728 = -25 40 = 25*40 = 1000ms
-            # see http://midi.teragonaudio.com/tech/midifile/mthd.htm
-            self.divisions = self._bytes_to_int(stream.read(2), True)
-            if self.divisions < 0:
-                raise NotImplementedError("Cowardly refusing to import SMPTE format midi file.")
-#            print("level=", level, "tracks=", tracks, "divisions=", divisions)
-            # process all the tracks in the file
-            for _ in range(tracks):
-                self._read_track(stream, secs)
+            # small files are read into memory. large files are mapped and
+            # parsed in place so they are not copied, payloads sliced from
+            # the map are copies so nothing refers to it after it closes.
+            if os.fstat(stream.fileno()).st_size < _mmap_min_size:
+                self._read_data(stream.read(), pathname, secs)
+            else:
+                with mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                    self._read_data(data, pathname, secs)
         return self
 
+    def _read_data(self, data, pathname, secs):
+        """Parses the midi file's data into the MidiFile."""
+        self.clear()
+        self.pathname = pathname # restore the pathname after clearing!
+        length, pos = self._read_chunk_length(data, 0, b'MThd')
+        assert length == 6, "MThd chunk length 6 not found."
+        # the header data is the level, the number of tracks and the
+        # divisions. read divisions as a two byte signed quantity. if its positive
+        # then it represents ticks per quarter. if its negative then its
+        # smpte format where the upper byte contains -24, -25 or -30,
+        # and the lower byte is positive subframes. Example: millisecond
+        # smpte timing would be 0xE728 = -25 40 = 25*40 = 1000ms
+        # see http://midi.teragonaudio.com/tech/midifile/mthd.htm
+        self.level, tracks, self.divisions = _MThd.unpack_from(data, pos)
+        pos += length
+        if self.divisions < 0:
+            raise NotImplementedError("Cowardly refusing to import SMPTE format midi file.")
+        # process all the tracks in the file
+        for _ in range(tracks):
+            pos = self._read_track(data, pos, secs)
+
     def write(self, secs=True):
         """
         Writes the MidiFile's track data to the file in MidiFile.pathname.
@@ -173,13 +218,11 @@ class MidiFile:
         pathname = self.pathname # self.fileversion(pathname)
         with open(pathname, "wb") as stream:
             self._write_chunk_length(stream, b'MThd', 6)
-            stream.write(self._int_to_bytes(level, 2))
-            stream.write(self._int_to_bytes(trnum, 2))
-            stream.write(self._int_to_bytes(divs, 2))
+            stream.write(_MThd.pack(level, trnum, divs))
             force_tempo = False
             # if the first event in the first track is not a
             # tempo event then force tempo==60.
-            if not isinstance(self.tracks[0][0], me.MidiEvent) or not self.tracks[0][0].is_meta(mm.kTempo):
+            if not isinstance(self.tracks[0][0], me.MidiEvent) or not self.tracks[0][0].is_meta_type(mm.kTempo):
                 force_tempo = True
             microdivs = 0
             if hasattr(self.tracks[0], "metatrack"):
@@ -290,10 +333,7 @@ class MidiFile:
         if not (1 <= microdivs <= 16):
             raise ValueError(f"invalid microtuning value: {microdivs}.")
         if microdivs > 1:
-            values = cls._channel_tuning(microdivs)
-            for c,v in enumerate(values):
-                # calculate the pitch bend value
-                b = round(rescale(v, -2,  2,  0, 16383))
+            for c,b in enumerate(_channel_bends[microdivs]):
                 meta.append(me.MidiEvent.pitch_bend(c, b))
         metaseq = Seq()
         metaseq.events = meta
@@ -319,176 +359,189 @@ class MidiFile:
         """Impelements the iterator protocol."""
         return len(self.tracks)
 
-    @staticmethod
-    def _int_to_bytes(val, num):
-        """Converts integer value into the specified number of bytes."""
-        return val.to_bytes(num, 'big')
-
-    @staticmethod
-    def _bytes_to_int(bytez, sign=False):
-        """Returns integer value of bytes."""
-        return int.from_bytes(bytez, 'big', signed=sign)
-
-    def _read_chunk_length(self, stream, ident):
-        assert stream.read(4) == ident, f"Chunk {ident} not found."
-        return self._bytes_to_int(stream.read(4))
+    def _read_chunk_length(self, data, pos, ident):
+        """
+        Reads the chunk header at pos in the file data and returns the
+        chunk's length and the position of its contents.
+        """
+        chunk, length = _chunk_header.unpack_from(data, pos)
+        assert chunk == ident, f"Chunk {ident} not found."
+        return length, pos + _chunk_header.size
 
     def _write_chunk_length(self, stream, ident, length):
-        stream.write(ident)
-        stream.write(self._int_to_bytes(length, 4))
-
-    def _read_varlen_value(self, stream):
-        """Reads a variable length quantity and returns its integer value."""
-        value = self._bytes_to_int(stream.read(1))
-        if value & 0x80:   # value's top bit is 1 so keep reading
-            value &= 0x7F  # its actual value is the lower 7 bits
-            while True:
-                value <<= 7  # left shift to make room for next byte
-                other = self._bytes_to_int(stream.read(1))
-                value += other & 0x7F
-                if not other & 0x80:  # done if upper bit is not 1
-                    break
-        return value
+        stream.write(_chunk_header.pack(ident, length))
+
+    def _read_varlen_value(self, buf, pos):
+        """
+        Reads a variable length quantity from the file data at pos and
+        returns its integer value and the position after it.
+        """
+        # most delta times fit in one byte, return those without looping.
+        b = buf[pos]
+        pos += 1
+        if b < 0x80:
+            return b, pos
+        value = b & 0x7F
+        while True:
+            b = buf[pos]
+            pos += 1
+            value = (value << 7) | (b & 0x7F)  # add the lower 7 bits
+            if not b & 0x80:  # done if upper bit is not 1
+                return value, pos
 
     @staticmethod
-    def _write_varlen_value(stream, val):
-        """Writes integer value as variable length quantity."""
-        vlq = []
-        for i in range(21, 0, -7):
-            if val >= (1 << i):
-                vlq.append(((val >> i) & 0x7F) | 0x80)
-        vlq.append(val & 0x7F)
-        #print("val=", val, "vlq=", vlq)
-        #stream.write(bytes(vlq))
-        for b in vlq:
-            stream.write(MidiFile._int_to_bytes(b, 1))
-
-    def _read_meta_message(self, stream):
-        metatype = self._bytes_to_int(stream.read(1))
-        length = self._read_varlen_value(stream)
-        if mm.kText <= metatype <= mm.kDevName:
-            return [0xFF, metatype, length, stream.read(length)]
-        if metatype in [mm.kChanPrefix, mm.kMidiPort, mm.kTempo,
-                        mm.kSMPTEOff, mm.kTimeSig, mm.kKeySig,
-                        mm.kSeqNumber]:
-            msg = [0xFF, metatype, length]
-            for n in stream.read(length):
-                msg.append(n)
-            return msg
-        if metatype == mm.kEOT:
-            return [0xFF, metatype, length]
-        if metatype == mm.kSeqEvent:
-            return [0xFF, metatype, length, stream.read(length)]
-        raise NotImplementedError(f"_read_meta_message: unhandled metatype {hex(metatype)}.")
-
-    def _read_channel_message(self, stream, status):
-        stat = status & 0xF0
-        if mm.kNoteOff <= stat < mm.kProgChange or stat > mm.kChanPress:
-            # two data bytes: note off, note on, aftertouch, controller, and pitchbend
-            val1 = self._bytes_to_int(stream.read(1))
-            val2 = self._bytes_to_int(stream.read(1))
-            return [status, val1, val2]
+    def _write_varlen_value(buf, val):
+        """Appends integer value to buf as variable length quantity."""
+        # a quantity is at most 4 bytes, all but the last byte have their
+        # upper bit set. most delta times fit in one byte.
+        if val < 0x80:
+            buf.append(val)
+        elif val < 0x4000:
+            buf.extend((val >> 7 | 0x80, val & 0x7F))
+        elif val < 0x200000:
+            buf.extend((val >> 14 | 0x80, (val >> 7) & 0x7F | 0x80, val & 0x7F))
         else:
-            # one data byte:  program change, channel pressure
-            val1 = self._bytes_to_int(stream.read(1))
-            return [status, val1]
-
-    def _read_sysex_message(self, stream, status):
+            buf.extend((val >> 21 | 0x80, (val >> 14) & 0x7F | 0x80,
+                        (val >> 7) & 0x7F | 0x80, val & 0x7F))
+
+    def _read_meta_message(self, buf, pos):
+        metatype = buf[pos]
+        if metatype not in _meta_types:
+            raise NotImplementedError(f"_read_meta_message: unhandled metatype {hex(metatype)}.")
+        length, end = self._read_varlen_value(buf, pos + 1)
+        end += length
+        # metas are flat bytes like the ones midimsg creates, so the message
+        # is the slice from its 0xFF status byte to the end of its data.
+        return buf[pos - 1:end], end
+
+    def _read_sysex_message(self, buf, pos):
         # Note: the length includes the terminal EOE
-        length = self._read_varlen_value(stream)
-        return [status, length, stream.read(length)]
-
-    def _read_message(self, stream):
-        # [:1] because peek can return more than one byte
-        status = self._bytes_to_int(stream.peek(1)[:1])
-        if status & 0x80:
-            # have a channel message
-            if status < mm.kSysEx:
-                self._running_status = status
-            stream.read(1)
-        else:
-            status = self._running_status
-            assert status & 0x80, "status byte not found."
-
-        if status < mm.kSysEx:  # a channel message
-            return self._read_channel_message(stream, status)
-        elif status == mm.kSysEx or status <= mm.kEOE:  # a sysex message
-            self._running_status = 0
-            return self._read_sysex_message(stream, status)
+        length, end = self._read_varlen_value(buf, pos)
+        end += length
+        # sysex never uses running status so its status byte is at pos - 1.
+        return buf[pos - 1:end], end
+
+    def _read_message(self, buf, pos):
+        """
+        Reads the system message at pos in the file data and returns it
+        with the position after it. Channel messages and running status
+        are decoded by _read_track.
+        """
+        status = buf[pos]
+        pos += 1
+        if status == mm.kSysEx or status <= mm.kEOE:  # a sysex message
+            return self._read_sysex_message(buf, pos)
         elif status == mm.kMetaMsg:  # a meta message
-            self._running_status = 0
-            return self._read_meta_message(stream)
+            return self._read_meta_message(buf, pos)
         else:
             raise NotImplementedError(f"channel status {hex(status)} unsupported.")
 
     @staticmethod
-    def _write_message(stream, message):
-        status = message[0]
-        if status < mm.kSysEx:
-            #print("writing", message)
-            for b in message:
-                stream.write(MidiFile._int_to_bytes(b, 1))
-            #stream.write(bytes(message))
-        elif status == mm.kMetaMsg:
-            stream.write(MidiFile._int_to_bytes(status, 1))
-            meta = message[1]
-            stream.write(MidiFile._int_to_bytes(meta, 1))
-            if mm.kText <= meta <= mm.kDevName or meta == mm.kSeqEvent:
-                MidiFile._write_varlen_value(stream, message[2])
-                stream.write(message[3])  # a bytes struct
-            else:
-                for b in message[2:]:
-                    stream.write(MidiFile._int_to_bytes(b, 1))
-                # stream.write(bytes(message[2:]))
-        elif status == mm.kSysEx or status == mm.kEOE:
-            stream.write(status)
-            MidiFile._write_varlen_value(stream, message[1])
-            stream.write(message[2])  # a bytes struct
-        else:
+    def _write_message(buf, message):
+        writer = _message_writers.get(message[0])
+        if not writer:
             raise NotImplementedError(f"Unsupported message: {message}.")
+        writer(buf, message)
 
-    def _read_track(self, stream, tosecs):
+    def _read_track(self, data, pos, tosecs):
+        """
+        Reads the track chunk at pos in the file data and returns the
+        position after it.
+        """
         abs_delta = 0
-        # read the length of the track. since this is not dependable we
-        # ignore it and use the required EOT message to stop the track.
-        self._read_chunk_length(stream, b'MTrk')
-        self._running_status = 0
+        # the required EOT message stops the track, the chunk length bounds
+        # it if EOT is missing.
+        length, pos = self._read_chunk_length(data, pos, b'MTrk')
+        track_end = pos + length
         trk = []
-        while True:
-            delta = self._read_varlen_value(stream)
+        # messages parsed from the file are already valid so events are
+        # created without running MidiEvent.__init__ and its setters.
+        MidiEvent = me.MidiEvent
+        new_event = MidiEvent.__new__
+        # bind the names used for every event to locals.
+        read_varlen_value = self._read_varlen_value
+        read_message = self._read_message
+        is_meta_message_type = mm.is_meta_message_type
+        kEOT = mm.kEOT
+        divs = self.divisions
+        append = trk.append
+        # one byte delta times and channel messages (the bulk of a track)
+        # are decoded inline, everything else goes through the readers.
+        running_status = 0
+        while pos < track_end:
+            delta = data[pos]
+            if delta < 0x80:
+                pos += 1
+            else:
+                delta, pos = read_varlen_value(data, pos)
             abs_delta += delta
-            msg = self._read_message(stream)
-            # print(delta, msg)
-            # break on EOT, which is required by the midifile spec.
-            if mm.is_meta_message_type(msg, mm.kEOT):  # mm.is_meta_eot(msg):
-                break
-            time = abs_delta / self.divisions if tosecs else abs_delta
-            trk.append(me.MidiEvent(msg, time))
+            status = data[pos]
+            if status < mm.kSysEx:
+                # channel messages are bytes, like the ones midimsg creates,
+                # so a message with its status byte is a single slice.
+                if status & 0x80:
+                    running_status = status
+                    end = pos + 1 + _channel_data_lengths[status >> 4]
+                    msg = data[pos:end]
+                else:
+                    status = running_status
+                    assert status, "status byte not found."
+                    end = pos + _channel_data_lengths[status >> 4]
+                    msg = bytes((status,)) + data[pos:end]
+                pos = end
+                kind = status & mm.kStatusMask
+            else:
+                msg, pos = read_message(data, pos)
+                running_status = 0
+                # break on EOT, which is required by the midifile spec.
+                if is_meta_message_type(msg, kEOT):  # mm.is_meta_eot(msg):
+                    break
+                kind = status
+            ev = new_event(MidiEvent)
+            ev._message = msg
+            ev._status = kind
+            ev._time = abs_delta / divs if tosecs else abs_delta
+            append(ev)
         # add the track as a sequence in the midi file
         self.tracks.append(Seq(trk))
+        return track_end
 
     def _write_track(self, stream, track, divs, microdivs, force_tempo=False):
-        ##print("write_track------------------------------")
-        #track.print()
-        self._write_chunk_length(stream, b'MTrk', 0)
-        # save the begin position of this track.
-        track_beg = stream.tell()
-        # the previous time, used to calculate delta times between events.
-        prev_time = 0
+        # collect the track's bytes and write the chunk once its length
+        # is known.
+        buf = bytearray()
+        # the previous event's absolute time in ticks, used to calculate
+        # delta times between events. converting absolute times (rather than
+        # the time differences) to ticks keeps truncation error from
+        # accumulating over the track.
+        prev_tick = 0
         # If force_tempo is True then this is the first track
         # and the user did not provide a tempo marking. In
         # this case write an initial tempo message for mm=60
         if force_tempo:
-            MidiFile._write_varlen_value(stream, 0)
-            MidiFile._write_message(stream, mm.meta_tempo(1000000))
-        # pending queue of note offs, used if the track contains Note objects.
+            MidiFile._write_varlen_value(buf, 0)
+            MidiFile._write_message(buf, mm.meta_tempo(1000000))
+        # pending note offs, used if the track contains Note objects. the
+        # queue is a heap of (time, order, message) entries, the order
+        # keeps offs with the same time in the order they were added.
         off_queue = []
+        off_order = itertools.count()
+        # bind the per-event writers once rather than looking them up
+        # on the class for every event.
+        write_varlen = MidiFile._write_varlen_value
+        write_message = MidiFile._write_message
+        write_offs = MidiFile._write_offs
+        append = buf.append
+        extend = buf.extend
+        heappush = heapq.heappush
+        note_on = mm.note_on
+        note_off = mm.note_off
+        kSysEx = mm.kSysEx
         # write out all the events in the track
-        ##foo = 0
         for ev in track.serialize():
-            ##print(foo,"\t", ev); foo += 1
-            # write out any pending offs <= ev.time
-            prev_time = MidiFile._write_offs(stream, off_queue, ev.time, prev_time, divs)
+            time = ev.time
+            # write out any pending offs <= time
+            prev_tick = write_offs(buf, off_queue, time, prev_tick, divs)
             # if we encounter a Note object, enqueue a note off and write a note on immediately.
             if isinstance(ev, Note):
                 chan = ev.instrument
@@ -499,45 +552,47 @@ class MidiFile:
                         chan, key = MidiFile._microtune(chan, key, microdivs)
                     else:
                         key = int(key)
-                noteon  = me.MidiEvent([mm.kNoteOn | chan, key, vel], ev.time)
-                noteoff = me.MidiEvent([mm.kNoteOff | chan, key, 127], ev.time+ev.duration)
-                MidiFile._enqueue_off(noteoff, off_queue)
-                ev = noteon
-            #print("ev.message", ev.message)
-            delta = int((ev.time - prev_time) * divs)
-            MidiFile._write_varlen_value(stream, delta)
-            MidiFile._write_message(stream, ev.message)
-            prev_time = ev.time
+                heappush(off_queue, (time + ev.duration, next(off_order),
+                                     note_off(chan, key, 127)))
+                message = note_on(chan, key, vel)
+            else:
+                message = ev.message
+            tick = round(time * divs)
+            delta = tick - prev_tick
+            # a one byte delta and a channel message (the common case) are
+            # copied straight into the buffer.
+            if delta < 0x80:
+                append(delta)
+            else:
+                write_varlen(buf, delta)
+            if message[0] < kSysEx:
+                extend(message)
+            else:
+                write_message(buf, message)
+            prev_tick = tick
         # flush any remaining note offs.
-        MidiFile._write_offs(stream, off_queue, prev_time, prev_time, divs, True)   
+        write_offs(buf, off_queue, 0, prev_tick, divs, True)
         # add a 0 delta and EOT
-        MidiFile._write_varlen_value(stream, 0)
-        MidiFile._write_message(stream, mm.meta_eot())
-        # calculate the length of the track we just wrote
-        track_end = stream.tell()
-        track_len = track_end - track_beg
-        # go to track header's 4-byte length field and write the length
-        stream.seek(track_beg - 4)
-        stream.write(self._int_to_bytes(track_len, 4))
-        # reposition back here to write the next track
-        stream.seek(track_end)
-
-    @staticmethod
-    def _enqueue_off(off, queue):
-        """Adds a note off to the note off queue at the latest possible position."""
-        i = 0; l = len(queue)
-        while i < l and queue[i].time <= off.time:
-            i += 1
-        queue.insert(i, off)
+        write_varlen(buf, 0)
+        write_message(buf, mm.meta_eot())
+        self._write_chunk_length(stream, b'MTrk', len(buf))
+        stream.write(buf)
 
     @staticmethod
-    def _write_offs(stream, queue, time, prev, divs, all=False):
-        """Writes offs <= current time, returns updated previous time."""
-        while (queue and (all or (queue[0].time <= time))):
-            MidiFile._write_varlen_value(stream, int((queue[0].time - prev) * divs))
-            MidiFile._write_message(stream, queue[0].message)
-            prev = queue.pop(0).time
-        return prev 
+    def _write_offs(buf, queue, time, prev, divs, all=False):
+        """Writes offs <= current time, returns updated previous tick."""
+        write_varlen = MidiFile._write_varlen_value
+        while (queue and (all or (queue[0][0] <= time))):
+            offtime, _, message = heapq.heappop(queue)
+            tick = round(offtime * divs)
+            delta = tick - prev
+            if delta < 0x80:
+                buf.append(delta)
+            else:
+                write_varlen(buf, delta)
+            buf.extend(message)  # a note off
+            prev = tick
+        return prev
 
     @staticmethod
     def _microtune(channel, floatkey, microdivs):
@@ -548,11 +603,14 @@ class MidiFile:
         microincr = 1.0 / microdivs        # microtonal increment
         keynumber = int(floatkey)          # int version
         remainder = floatkey - keynumber   # float's fractional portion is microtones
-        microchan = 0                      # the microtonal channel to shift to
-        for i in range(0, microdivs +1 ):  # iterate number of divisions plus 1.
-            if microincr * i <= remainder < microincr * (i + 1): # found rem in this bucket!
-                microchan = i              # offset to microtuned channel in midi file.
-                break
+        # the microtonal channel to shift to is the bucket that holds the
+        # remainder. truncating remainder * microdivs finds it except when
+        # rounding lands on a bucket edge, so check against the edges.
+        microchan = int(remainder * microdivs)
+        if microincr * microchan > remainder:
+            microchan -= 1
+        elif microincr * (microchan + 1) <= remainder:
+            microchan += 1
         channel += microchan               # shift note to microtuned channel
         return channel, keynumber
 
@@ -582,9 +640,11 @@ class MidiFile:
         A sequence of microdivs adjustments for all 16 channels.
         """
         microdivs = max(1, min(16, microdivs))
-        cents = [0.0]
-        for i in range(1, microdivs):
-            cents.append(1.0 * i/microdivs)
         # return a row of 16 repeating cent values
-        return [cents[i % len(cents)] for i in range(16)]
-    
+        return [(i % microdivs) / microdivs for i in range(16)]
+
+
+# The pitch bend values that tune the 16 channels for each microdivs
+# setting, computed once for all the settings metatrack() accepts.
+_channel_bends = {m: tuple(round(rescale(v, -2, 2, 0, 16383)) for v in MidiFile._channel_tuning(m))
+                  for m in range(2, 17)}
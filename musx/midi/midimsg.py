@@ -1,8 +1,12 @@
 """
 A module that defines low level constructors and accessors for manipulating 
-lists of bytes as midi messsages.
+midi messsages. Messages are immutable bytes objects laid out as they are
+in a midi file: variable length messages (sysex, text meta and sequencer
+events) hold the length of their data as a variable length quantity.
 """
 
+import struct
+
 # Channel Messages
 kNoteOff     = 0b10000000
 kNoteOn      = 0b10010000
@@ -60,9 +64,14 @@ kfps30drop = 2
 kfps30     = 3
 
 
+# Maps a message's first byte to its status: channel messages lose their
+# channel bits, system and meta status bytes are their own status.
+_status_table = bytes((b & kStatusMask) if b < kSysEx else b for b in range(256))
+
+
 def status(msg):
     """Returns the status byte of the message."""
-    return (msg[0] & kStatusMask) if is_channel_message(msg) else msg[0]
+    return _status_table[msg[0]]
 
 
 def has_status(msg, stat):
@@ -83,6 +92,11 @@ def channel(msg):
     return msg[0] & kChannelMask
 
 
+# Packers for the two and three byte channel messages.
+_pack2 = struct.Struct('BB').pack
+_pack3 = struct.Struct('BBB').pack
+
+
 # Note Off and Note On
 
 
@@ -99,7 +113,7 @@ def note_off(chan, key, vel):
     vel : byte
         The velocity of the key up.
     """
-    return [kNoteOff | chan, key, vel]
+    return _pack3(kNoteOff | chan, key, vel)
 
 
 def note_on(chan, key, vel):
@@ -115,7 +129,7 @@ def note_on(chan, key, vel):
     vel : byte
         The velocity of the key down.
     """
-    return [kNoteOn | chan, key, vel]
+    return _pack3(kNoteOn | chan, key, vel)
 
 
 def keynum(msg):
@@ -144,7 +158,7 @@ def aftertouch(chan, key, press):
     press : byte
         The pressure value.
     """
-    return [kAftertouch | chan, key, press]
+    return _pack3(kAftertouch | chan, key, press)
 
 
 def touch(msg):
@@ -168,7 +182,7 @@ def control_change(chan, ctrl, val):
     val : byte
         The controller value.
     """ 
-    return [kCtrlChange | chan, ctrl, val]
+    return _pack3(kCtrlChange | chan, ctrl, val)
 
 
 def controller(msg):
@@ -195,7 +209,7 @@ def program_change(chan, prog):
     prog : byte
         The program value.
     """
-    return [kProgChange | chan, prog]
+    return _pack2(kProgChange | chan, prog)
 
 
 def program(msg):
@@ -217,13 +231,13 @@ def channel_pressure(chan, press):
     press : byte
         The pressure value.
     """ 
-    return [kChanPress | chan, press]
+    return _pack2(kChanPress | chan, press)
 
 
 def pressure(msg):
     """Returns the pressure value of a channel pressure message."""
-    if status(msg) == kAftertouch:
-        assert False, "shouldnt happen"
+    # an aftertouch message's pressure is its third byte, not its second.
+    assert msg[0] & kStatusMask != kAftertouch, "not a channel pressure message."
     return msg[1]
 
 
@@ -241,7 +255,7 @@ def pitch_bend(chan, value):
     value : integer
         The 14-bit pitch bend value.
     """
-    return [kPitchBend | chan, value & 0x7F, (value >> 7) & 0x7F]
+    return _pack3(kPitchBend | chan, value & 0x7F, (value >> 7) & 0x7F)
 
 
 def bend(msg):
@@ -395,9 +409,19 @@ def sysex(data):
     data : list
         A list of data bytes ending with EOE.
     """
-    if data[-1] != kEOE:
-        data.append(kEOE)  # make sure data includes EOE
-    return [kSysEx, len(data), bytes(data)]
+    payload = bytes(data)
+    if not payload or payload[-1] != kEOE:
+        payload += bytes((kEOE,))  # make sure data includes EOE
+    # laid out as in a midi file: status, payload length, payload.
+    return bytes((kSysEx, *int_to_vlq(len(payload)))) + payload
+
+
+def sysex_data(msg):
+    """
+    Returns a memoryview on the sysex message's data bytes, without the
+    length or the EOE byte.
+    """
+    return memoryview(msg)[_data_start(msg, 1):-1]
 
 
 def midi_time_code(typ, val):
@@ -411,7 +435,7 @@ def midi_time_code(typ, val):
     value : byte
         The type code value.
     """
-    return [kTimeCode, (typ << 4) | val]
+    return bytes((kTimeCode, (typ << 4) | val))
 
 
 def midi_song_position(pos):
@@ -425,7 +449,7 @@ def midi_song_position(pos):
     """
     lsb = pos & 0x7F
     msb = pos >> 7
-    return [kSongPos, lsb, msb]
+    return bytes((kSongPos, lsb, msb))
 
 
 def midi_song_select(song):
@@ -437,17 +461,17 @@ def midi_song_select(song):
     song : byte
         The song number to set.
     """
-    return [kSongSel, song]
+    return bytes((kSongSel, song))
 
 
 def midi_tune_request():
     """Creates a midi tune request message."""
-    return [kTuneReq]
+    return bytes((kTuneReq,))
 
 
 def midi_end_of_exclusive():
     """Creates an end of exclusive message."""
-    return [kEOE]
+    return bytes((kEOE,))
 
 
 # System Real Time Messages (these are not valid in midi files.)
@@ -455,32 +479,32 @@ def midi_end_of_exclusive():
 
 def midi_clock():
     """Creates a midi clock message."""
-    return [kTimingClock]
+    return bytes((kTimingClock,))
 
 
 def midi_start():
     """Creates a midi start message."""
-    return [kStart]
+    return bytes((kStart,))
 
 
 def midi_continue():
     """Creates a midi continue message."""
-    return [kContinue]
+    return bytes((kContinue,))
 
 
 def midi_stop():
     """Creates a midi stop message."""
-    return [kStop]
+    return bytes((kStop,))
 
 
 def active_sensing():
     """Creates an active sensing midi message."""
-    return [kActiveSens]
+    return bytes((kActiveSens,))
 
 
 def midi_reset():
     """Creates a midi reset message."""
-    return [kReset]
+    return bytes((kReset,))
 
 
 # Midi Meta Messages. (these have the same upper byte value 0xFF as
@@ -498,16 +522,37 @@ def is_meta_message_type(msg, typ):
     return is_meta_message(msg) and msg[1] == typ
 
 
+def _data_start(msg, pos):
+    """
+    Returns the index of the data in a sysex or variable length meta
+    message whose length quantity begins at pos.
+    """
+    # all but the last byte of the quantity have their upper bit set.
+    while msg[pos] & 0x80:
+        pos += 1
+    return pos + 1
+
+
+def payload(msg):
+    """
+    Returns the data bytes of a sysex message (including its EOE) or of
+    a text or sequencer specific meta message.
+    """
+    return msg[_data_start(msg, 1 if msg[0] < kMetaMsg else 2):]
+
+
 def int_to_vlq(val):
     """
     Converts an integer value into a variable length quantity (list).
     """
-    vlq = []
-    for i in range(21, 0, -7):
-        if val >= (1 << i):
-            vlq.append(((val >> i) & 0x7F) | 0x80)
-    vlq.append(val & 0x7F)
-    return vlq
+    if val < 0x80:
+        return [val]
+    if val < 0x4000:
+        return [val >> 7 | 0x80, val & 0x7F]
+    if val < 0x200000:
+        return [val >> 14 | 0x80, (val >> 7) & 0x7F | 0x80, val & 0x7F]
+    return [val >> 21 | 0x80, (val >> 14) & 0x7F | 0x80,
+            (val >> 7) & 0x7F | 0x80, val & 0x7F]
 
 
 def meta_seq_number(num):
@@ -519,9 +564,9 @@ def meta_seq_number(num):
     num : byte
         The sequence number
     """
-    msb = num & (0x7F << 7)
-    lsb = num & 0x7f
-    return [kMetaMsg, kSeqNumber, 2, msb, lsb]
+    msb = (num >> 8) & 0xFF
+    lsb = num & 0xFF
+    return bytes((kMetaMsg, kSeqNumber, 2, msb, lsb))
 
 
 def text_meta_message(metatype, txt):
@@ -537,14 +582,17 @@ def text_meta_message(metatype, txt):
     """
     data = txt.encode('ascii') if isinstance(txt, str) else txt
     assert isinstance(data, bytes), "meta text message data is not bytes()."
-    return [kMetaMsg, metatype, len(data), data]
+    length = len(data)
+    if length < 0x80:  # most texts are names with a one byte length
+        return bytes((kMetaMsg, metatype, length)) + data
+    return bytes((kMetaMsg, metatype, *int_to_vlq(length))) + data
 
 
 def text(meta):
     """
     Returns the meta message's text as a string.
     """
-    return meta[3].decode('ascii')
+    return payload(meta).decode('ascii')
 
 
 def meta_text(txt):
@@ -664,7 +712,7 @@ def meta_chan_prefix(chan):
     chan : byte
     The channel prefix number.
     """
-    return [kMetaMsg, kChanPrefix, 1, chan]
+    return bytes((kMetaMsg, kChanPrefix, 1, chan))
 
 
 def meta_port(port):
@@ -672,12 +720,16 @@ def meta_port(port):
     Creates a port meta message.
     Note: **This meta event is depreciated in the midi spec.**
     """
-    return [kMetaMsg, kMidiPort, 1, port]
+    return bytes((kMetaMsg, kMidiPort, 1, port))
 
  
 def meta_eot():
     """Creates an end of track meta message."""
-    return [kMetaMsg, kEOT, 0]
+    return bytes((kMetaMsg, kEOT, 0))
+
+
+_tempo_header = bytes((kMetaMsg, kTempo, 3))
+_pack_uint32 = struct.Struct('>I').pack
 
 
 def meta_tempo(usecs_per_quarter):
@@ -689,10 +741,8 @@ def meta_tempo(usecs_per_quarter):
     usecs_per_quarter : int
         The number of microseconds in a quarter note.
     """
-    msg = [kMetaMsg, kTempo, 3]
-    for i in range(16, -1, -8):
-        msg.append((usecs_per_quarter & (0xff << i)) >> i)
-    return msg
+    # the tempo is the low three bytes of a big-endian 32 bit int.
+    return _tempo_header + _pack_uint32(usecs_per_quarter & 0xFFFFFF)[1:]
 
 
 def tempo(msg):
@@ -715,7 +765,7 @@ def meta_time_sig(top, bot, clocks=24, tsecs=8):
     tsecs : byte
         the number of 32nds in a quarter note (usually 8).
     """
-    return [kMetaMsg, kTimeSig, 4, top, bot, clocks, tsecs]
+    return bytes((kMetaMsg, kTimeSig, 4, top, bot, clocks, tsecs))
 
 
 def meta_key_sig(sf, mode):
@@ -729,7 +779,8 @@ def meta_key_sig(sf, mode):
     mode : 0 or 1
         Specify 0 for major keys and 1 for minor keys.
     """
-    return [kMetaMsg, kKeySig, 2, sf, mode]
+    # sf is stored as a twos-complement byte.
+    return bytes((kMetaMsg, kKeySig, 2, sf & 0xFF, mode))
 
 
 def meta_seq_event(data):
@@ -741,4 +792,5 @@ def meta_seq_event(data):
     data : list
         A list of bytes to send to the sequencer.   
     """
-    return [kMetaMsg, kSeqEvent, len(data), bytes(data)]
+    data = bytes(data)
+    return bytes((kMetaMsg, kSeqEvent, *int_to_vlq(len(data)))) + data
@@ -10,10 +10,25 @@ class Barline:
     To create a Barline don't call the constructor directly, call one of the class
     factory methods listed below. 
     """
+    __slots__ = ('ident', 'location', '_str')
 
     def __init__(self, ident, location):
         self.ident = ident
         self.location = location
+        # barlines are immutable so their print string is made once.
+        self._str = f'<Barline: {type(self)._names[ident]} pos={location}>'
+
+    _pool = {}
+
+    @classmethod
+    def _pooled(cls, ident, location):
+        # barlines are never modified after creation so each (ident, location)
+        # pair is created once and shared.
+        key = (cls, ident, location)
+        barline = Barline._pool.get(key)
+        if barline is None:
+            barline = Barline._pool[key] = cls(ident, location)
+        return barline
 
     @classmethod
     def BackwardRepeat(cls, location):
@@ -23,55 +38,55 @@ class Barline:
         location: str
             Either "left", "right" or "both".
         """
-        return cls(11, location)
+        return cls._pooled(11, location)
 
     @classmethod
     def Dashed(cls, location):
-        return cls(3, location)
+        return cls._pooled(3, location)
 
     @classmethod
     def Dotted(cls, location):
-        return cls(2, location)
+        return cls._pooled(2, location)
 
     @classmethod
     def DoubleRepeat(cls, location):
-        return cls(13, location)
+        return cls._pooled(13, location)
 
     @classmethod
     def FinalDouble(cls, location):
-        return cls(10, location)
+        return cls._pooled(10, location)
 
     @classmethod
     def ForwardRepeat(cls, location):
-        return cls(12, location)
+        return cls._pooled(12, location)
 
     @classmethod
     def Heavy(cls, location):
-        return cls(6, location)
+        return cls._pooled(6, location)
 
     @classmethod
     def HeavyHeavy(cls, location):
-        return cls(7, location)
+        return cls._pooled(7, location)
 
     @classmethod
     def HeavyLight(cls, location):
-        return cls(8, location)
+        return cls._pooled(8, location)
 
     @classmethod
     def InteriorDouble(cls, location):
-        return cls(9, location)
+        return cls._pooled(9, location)
 
     @classmethod
     def Regular(cls, location):
-        return cls(1, location)
+        return cls._pooled(1, location)
 
     @classmethod
     def Short(cls, location):
-        return cls(5, location)
+        return cls._pooled(5, location)
 
     @classmethod
     def Tick(cls, location):
-        return cls(4, location)
+        return cls._pooled(4, location)
 
     _names = {
             1: "Regular", 2: "Dotted", 3: "Dashed", 4: "Tick",  5: "Short", 6: "Heavy",
@@ -80,7 +95,7 @@ class Barline:
         }
 
     def __str__(self):
-        return f'<Barline: {type(self)._names[self.ident]} pos={self.location}>' #  {hex(id(self))}
+        return self._str
 
     __repr__ = __str__
 
@@ -20,13 +20,31 @@ _BOTTOM_LINE = 0
 class Clef:
     """
     To create a Clef don't call the constructor directly, call one of the class
-    factory methods listed below.
+    factory methods listed below. Clefs without a staff number are also
+    available as constants, e.g. Clef.TREBLE or Clef.BASS_8VA.
     """
+    __slots__ = ('staffnum', 'ident', 'linespace', 'transpostion', '_str')
+
     def __init__(self, staffnum, ident, linespace, transpostion):
         self.staffnum = staffnum
         self.ident = ident
         self.linespace = linespace
         self.transpostion = transpostion
+        # clefs are immutable so their print string is made once.
+        staff = "all" if staffnum == 0 else staffnum
+        self._str = f'<Clef: {type(self)._names[ident]} staff={staff}>'
+
+    _pool = {}
+
+    @classmethod
+    def _pooled(cls, staffnum, ident, linespace, transpostion):
+        # clefs are never modified after creation. linespace and transposition
+        # depend only on ident so (staffnum, ident) identifies a clef.
+        key = (cls, staffnum, ident)
+        clef = Clef._pool.get(key)
+        if clef is None:
+            clef = Clef._pool[key] = cls(staffnum, ident, linespace, transpostion)
+        return clef
 
     @classmethod
     def Alto(cls, staffnum=None):
@@ -37,68 +55,68 @@ class Clef:
             The MusicXml staff number of the clef. If zero then the clef is attached
             to all staffs.
         """
-        return cls(staffnum, 3, _MIDDLE_LINE, 0)
+        return cls._pooled(staffnum, 3, _MIDDLE_LINE, 0)
         
     @classmethod
     def Treble(cls, staffnum=None):
-        return cls(staffnum, 0, _LINE_BELOW_MIDDLE_LINE, 0)
+        return cls._pooled(staffnum, 0, _LINE_BELOW_MIDDLE_LINE, 0)
 
     @classmethod
     def Soprano(cls, staffnum=None):
-        return cls(staffnum, 1, _BOTTOM_LINE, 0)
+        return cls._pooled(staffnum, 1, _BOTTOM_LINE, 0)
 
     @classmethod
     def MezzoSoprano(cls, staffnum=None):
-        return cls(staffnum, 2, _LINE_BELOW_MIDDLE_LINE, 0)
+        return cls._pooled(staffnum, 2, _LINE_BELOW_MIDDLE_LINE, 0)
 
 
     @classmethod
     def Tenor(cls, staffnum=None):
-        return cls(staffnum, 4, _LINE_ABOVE_MIDDLE_LINE, 0)
+        return cls._pooled(staffnum, 4, _LINE_ABOVE_MIDDLE_LINE, 0)
 
     @classmethod
     def Baritone(cls, staffnum=None):
-        return cls(staffnum, 5, _TOP_LINE, 0)
+        return cls._pooled(staffnum, 5, _TOP_LINE, 0)
 
     @classmethod
     def Bass(cls, staffnum=None):
-        return cls(staffnum, 6, _LINE_ABOVE_MIDDLE_LINE, 0)
+        return cls._pooled(staffnum, 6, _LINE_ABOVE_MIDDLE_LINE, 0)
 
     @classmethod
     def Treble8va(cls, staffnum=None):
-        return cls(staffnum, 7, _LINE_BELOW_MIDDLE_LINE, 8)
+        return cls._pooled(staffnum, 7, _LINE_BELOW_MIDDLE_LINE, 8)
 
     @classmethod
     def Bass8va(cls, staffnum=None):
-        return cls(staffnum, 8, _LINE_ABOVE_MIDDLE_LINE, -8)
+        return cls._pooled(staffnum, 8, _LINE_ABOVE_MIDDLE_LINE, -8)
 
     @classmethod
     def Treble15ma(cls, staffnum=None):
-        return cls(staffnum, 9, _LINE_BELOW_MIDDLE_LINE, 15)
+        return cls._pooled(staffnum, 9, _LINE_BELOW_MIDDLE_LINE, 15)
 
     @classmethod        
     def Bass15ma(cls, staffnum=None):
-        return cls(staffnum, 10, _LINE_ABOVE_MIDDLE_LINE, -15)
+        return cls._pooled(staffnum, 10, _LINE_ABOVE_MIDDLE_LINE, -15)
 
     @classmethod
     def TenorTreble(cls, staffnum=None):
-        return cls(staffnum, 11, _LINE_BELOW_MIDDLE_LINE, -8)
+        return cls._pooled(staffnum, 11, _LINE_BELOW_MIDDLE_LINE, -8)
 
     @classmethod
     def BaritoneF(cls, staffnum=None):
-        return cls(staffnum, 12, _MIDDLE_LINE, 0)
+        return cls._pooled(staffnum, 12, _MIDDLE_LINE, 0)
 
     @classmethod
     def SubBass(cls, staffnum=None):
-        return cls(staffnum, 13, _TOP_LINE, 0)
+        return cls._pooled(staffnum, 13, _TOP_LINE, 0)
 
     @classmethod
     def FrenchViolin(cls, staffnum=None):
-        return cls(staffnum, 14, _BOTTOM_LINE, 0)
+        return cls._pooled(staffnum, 14, _BOTTOM_LINE, 0)
 
     @classmethod
     def Percussion(cls, staffnum=None):
-        return cls(staffnum, 15, _MIDDLE_LINE, 0)
+        return cls._pooled(staffnum, 15, _MIDDLE_LINE, 0)
 
     _names = {
             0: "Treble", 1: "Soprano", 2: "MezzoSoprano", 3: "Alto",
@@ -108,12 +126,22 @@ class Clef:
         }
 
     def __str__(self):
-        staff = "all" if self.staffnum == 0 else self.staffnum
-        return f'<Clef: {type(self)._names[self.ident]} staff={staff}>' #  {hex(id(self))}
+        return self._str
 
     __repr__ = __str__
 
 
+# Clefs without a staff number, shared by code that doesn't need one. For
+# example Clef.BASS is the same object as Clef.Bass().
+for _name, _const in [
+        ('Treble', 'TREBLE'), ('Soprano', 'SOPRANO'), ('MezzoSoprano', 'MEZZO_SOPRANO'),
+        ('Alto', 'ALTO'), ('Tenor', 'TENOR'), ('Baritone', 'BARITONE'), ('Bass', 'BASS'),
+        ('Treble8va', 'TREBLE_8VA'), ('Bass8va', 'BASS_8VA'), ('Treble15ma', 'TREBLE_15MA'),
+        ('Bass15ma', 'BASS_15MA'), ('TenorTreble', 'TENOR_TREBLE'), ('BaritoneF', 'BARITONE_F'),
+        ('SubBass', 'SUB_BASS'), ('FrenchViolin', 'FRENCH_VIOLIN'), ('Percussion', 'PERCUSSION')]:
+    setattr(Clef, _const, getattr(Clef, _name)())
+del _name, _const
+
 
 
 # class ClefType (Enum):
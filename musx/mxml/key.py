@@ -7,6 +7,20 @@ from .mode import Mode
 from ..interval import Interval
 
 
+# The Modes keyed by their upper case names, including the IONIAN and
+# AEOLIAN aliases.
+_modes_by_name = dict(Mode.__members__)
+
+# The whole and half steps of the major scale. Intervals are not modified
+# by transpose() so the steps share two instances.
+_M2, _m2 = Interval('M2'), Interval('m2')
+_major_steps = (_M2, _M2, _m2, _M2, _M2, _M2, _m2)
+
+# The steps from the tonic to the seventh degree of each mode, indexed by
+# the mode's tonic degree.
+_mode_steps = tuple((_major_steps[i:] + _major_steps[:i])[:-1] for i in range(7))
+
+
 class Key:
     """
     A key consists of an integer 'signum' representing the number of sharps or
@@ -23,39 +37,39 @@ class Key:
         The staff number to which the Key will be associated. If the
         value is 0 the key is associated will all staffs.
     """
-    # Private map of key signature numbers (-7 to 7) to Pitch.pnums
-    # representing the tonic notes of the major keys in the cycle of
-    # fifths. For example, the signum -1 maps to Pitch.pnum.F, the
-    # tonic of F major.
-    _tonics = {i-7: v for i, v in enumerate([
+    # Private tuple of Pitch.pnums representing the tonic notes of the
+    # major keys in the cycle of fifths, indexed by key signature number
+    # plus 7. For example, the signum -1 maps to Pitch.pnum.F, the tonic
+    # of F major.
+    _tonics = (
         Pitch.pnums.Cf, Pitch.pnums.Gf, Pitch.pnums.Df, Pitch.pnums.Af,
         Pitch.pnums.Ef, Pitch.pnums.Bf, Pitch.pnums.F, Pitch.pnums.C,
         Pitch.pnums.G, Pitch.pnums.D, Pitch.pnums.A, Pitch.pnums.E,
-        Pitch.pnums.B, Pitch.pnums.Fs, Pitch.pnums.Cs])}
+        Pitch.pnums.B, Pitch.pnums.Fs, Pitch.pnums.Cs)
 
-    # Private map returns a transposition interval for the key's tonic
-    # Pnum. Major is not included because it involves no transposition.
-    _transp = {Mode.MINOR: 'M6', Mode.DORIAN: 'M2',
-               Mode.PHRYGIAN: 'M3', Mode.LYDIAN: 'P4', Mode.MIXOLYDIAN: 'P5',
-               Mode.LOCRIAN: 'M7'}
+    # Private tuple of transposition intervals for the key's tonic Pnum,
+    # indexed by the mode's tonic degree. Major has no entry because it
+    # involves no transposition.
+    _transp = (None, Interval('M2'), Interval('M3'), Interval('P4'),
+               Interval('P5'), Interval('M6'), Interval('M7'))
+
+    __slots__ = ('signum', 'mode', 'staffid')
 
     def __init__(self, signum, mode, staffid):
         """
         Creates a Key from an integer key signature identifier and mode.
         """
-        if isinstance(signum, int):
-            if -7 <= signum <= 7:
-                if isinstance(mode, str):
-                    m = mode
-                    mode = Mode.__dict__.get(m.upper())
-                    if mode is None:
-                        raise ValueError(f"'{m}' is an invalid mode name.")
-                elif not isinstance(mode, Mode):
-                    raise TypeError(f'{signum} is not a Mode or mode name.')
-            else:
-                raise ValueError(f'{signum} is not a key signature between -7 and 7.')
-        else:
+        if not isinstance(signum, int):
             raise TypeError(f'{signum} is not a key signature between -7 and 7.')
+        if not -7 <= signum <= 7:
+            raise ValueError(f'{signum} is not a key signature between -7 and 7.')
+        if isinstance(mode, str):
+            name = mode
+            mode = _modes_by_name.get(name.upper())
+            if mode is None:
+                raise ValueError(f"'{name}' is an invalid mode name.")
+        elif not isinstance(mode, Mode):
+            raise TypeError(f'{mode} is not a Mode or mode name.')
         # The the number of flats or sharp, -7 to 7
         self.signum = signum
         # The Mode of the key.
@@ -63,16 +77,35 @@ class Key:
         # The staff number of the key (0=All)
         self.staffid = staffid
 
+    _pool = {}
+
+    @classmethod
+    def _fast(cls, signum, mode, staffid):
+        """
+        Returns a Key for internal callers that already hold an int signum
+        and a Mode, skipping __init__'s type checks and mode name lookup.
+        Keys are never modified after creation so each (signum, mode, staffid)
+        is created once and shared.
+        """
+        key = Key._pool.get((cls, signum, mode, staffid))
+        if key is None:
+            # file data is not range checked by the parser so keep this one.
+            if not -7 <= signum <= 7:
+                raise ValueError(f'{signum} is not a key signature between -7 and 7.')
+            key = cls.__new__(cls)
+            key.signum = signum
+            key.mode = mode
+            key.staffid = staffid
+            Key._pool[cls, signum, mode, staffid] = key
+        return key
+
     def __str__(self):
         """
         Returns the print representation of the key.
         """
         staff = "all" if self.staffid == 0 else self.staffid
         if self.mode:
-            # Force tonic pnum to display "#" and "b" as accidental.
-            text = self.tonic().name
-            text = text.replace('f', 'b') if 'f' in text else text.replace('s', '#')
-            text += f'-{self.mode.name.capitalize()}'
+            text = _name_table[self.signum, self.mode]
         else:
             text = str(abs(self.signum)) + " "
             if abs(self.signum) > 1: 
@@ -88,24 +121,35 @@ class Key:
         Returns a Pnum representing the key's tonic note. See `musx.pitch.Pitch`
         for documentation on Pnum.
         """
-        ton = self._tonics[self.signum]
-        if self.mode is Mode.MAJOR:
-            return ton
-        return Interval(self._transp[self.mode]).transpose(ton)
+        return _tonic_table[self.signum, self.mode]
 
     def scale(self):
         """
-        Returns a list of Pnums representing the pitches of the key's
-        diatonic scale. The octave completion is not included in the list.
+        Returns a tuple of Pnums representing the pitches of the key's
+        diatonic scale. The octave completion is not included in the tuple.
+        The tuple is shared by every Key with the same signum and mode; use
+        list(key.scale()) for a copy that can be modified.
         """
-        steps = [Interval('M2'), Interval('M2'), Interval('m2'),
-                 Interval('M2'), Interval('M2'), Interval('M2'),
-                 Interval('m2')]
-        start = self.mode.tonic_degree()
-        order = steps[start:] + steps[:start]
-        tonic = self.tonic()
-        scale = [tonic]
-        for s in order[:-1]:
-            tonic = s.transpose(tonic)
-            scale.append(tonic)
-        return scale
+        return _scale_table[self.signum, self.mode]
+
+
+# The tonic, the scale and the printed name of every key, keyed by (signum,
+# mode). There are only 105 keys so all three are computed once at import.
+_tonic_table = {}
+_scale_table = {}
+_name_table = {}
+for _signum in range(-7, 8):
+    for _mode in Mode:
+        _tonic = Key._tonics[_signum + 7]
+        if _mode is not Mode.MAJOR:
+            _tonic = Key._transp[_mode.tonic_degree()].transpose(_tonic)
+        _tonic_table[_signum, _mode] = _tonic
+        _scale = [_tonic]
+        for _step in _mode_steps[_mode.tonic_degree()]:
+            _scale.append(_step.transpose(_scale[-1]))
+        _scale_table[_signum, _mode] = tuple(_scale)
+        # Force tonic pnum to display "#" and "b" as accidental.
+        _name = _tonic.name
+        _name = _name.replace('f', 'b') if 'f' in _name else _name.replace('s', '#')
+        _name_table[_signum, _mode] = f'{_name}-{_mode.name.capitalize()}'
+del _signum, _mode, _tonic, _scale, _step, _name
@@ -72,11 +72,14 @@ class Mark (IntEnum):
     DEACCEL = TEMPORAL + 2
 
 
+    # Marks are ints so they are masked directly, going through the
+    # enum's value property costs more than the mask itself.
+
     def rank(self):
         """Returns the mark's rank number."""
-        return self.value & 0x00FF
+        return self & 0x00FF
 
     
     def group(self):
         """Returns the mark's group number."""
-        return self.value & 0xFF00
+        return self & 0xFF00
@@ -2,6 +2,7 @@
 A class that represents a measure of music in a Part.
 """
 
+from collections import defaultdict
 from ..note import Event, Note
 
 class Measure:
@@ -18,6 +19,10 @@ class Measure:
         The measure's unique integer identifier in its owning Part.
     """
 
+    # Scores hold thousands of measures. 'part' is the backpointer
+    # set by Part.add_measure().
+    __slots__ = ('id', 'elements', 'partial', 'onset', 'part')
+
     def __init__(self, id):
         self.id = id
         """The measure's integer identifier in its owning Part."""
@@ -41,14 +46,11 @@ class Measure:
         Returns a dictionary whose keys are the Measure's voice ids and whose
         values are the time ordered notes that belong to that voice.
         """
-        voices = {}
+        voices = defaultdict(list)
         for e in self.elements:
             if isinstance(e, Note):
-                v = e.get_mxml('voice',1)
-                try: voices[v].append(e)
-                except KeyError:
-                    voices[v] = [e]
-        return voices
+                voices[e.get_mxml('voice', 1)].append(e)
+        return dict(voices)
 
     def __iter__(self):
         """
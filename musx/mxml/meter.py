@@ -4,6 +4,10 @@ A class representing standard musical meters.
 
 from fractions import Fraction
 
+# Beats and measure durations keyed by (num, den). Fractions are immutable
+# so meters with the same num and den share them.
+_beats = {}
+_measure_durs = {}
 
 class Meter:
     """
@@ -18,6 +22,8 @@ class Meter:
     staffnum : int
         The staff number of the meter, 0 if meter applies to all staffs. 
     """
+    __slots__ = ('num', 'den', 'staffnum', '_str')
+
     def __init__(self, num, den, staffnum):
         if not isinstance(num, int):
             raise TypeError(f"Invalid meter numerator: {num}.")
@@ -25,7 +31,7 @@ class Meter:
             raise ValueError(f"Invalid meter numerator: {num}.")
         if not isinstance(den, int):
             raise TypeError(f"Invalid meter denominator: {den}.")
-        if not (den in [1, 2, 4, 8, 16, 32]):
+        if not (den in {1, 2, 4, 8, 16, 32}):
             raise ValueError(f"Invalid meter denominator: {den}.")
         if not isinstance(staffnum, int):
             raise ValueError(f"Invalid staff number: {num}")
@@ -35,13 +41,27 @@ class Meter:
         """The denominator number of the meter."""   
         self.staffnum = staffnum
         """The staff number of the meter (0=All)."""
+        # meters are immutable so their print string is made once.
+        staff = "all" if staffnum == 0 else staffnum
+        self._str = f"<Meter: {num}/{den} staff={staff}>"
+
+    _pool = {}
+
+    @classmethod
+    def _pooled(cls, num, den, staffnum):
+        # meters are never modified after creation so each (num, den,
+        # staffnum) is created and validated once and then shared.
+        key = (cls, num, den, staffnum)
+        meter = Meter._pool.get(key)
+        if meter is None:
+            meter = Meter._pool[key] = cls(num, den, staffnum)
+        return meter
 
     def __str__(self):
         """
         Returns the print representation of the meter.
         """
-        staff = "all" if self.staffnum == 0 else self.staffnum
-        return f"<Meter: {self.num}/{self.den} staff={staff}>" # {hex(id(self))
+        return self._str
 
     def __repr__(self):
         """
@@ -59,49 +79,49 @@ class Meter:
         """
         Returns true if the meter is compound (numerator 6, 9, 12, or 15).
         """
-        return self.num in [6, 9, 12, 15]
+        return self.num in {6, 9, 12, 15}
 
     def is_simple(self):
         """
         Returns true if the meter is simple (numerator 1, 2, 3, or 4).
         """
-        return self.num in [1, 2, 3, 4]
+        return self.num in {1, 2, 3, 4}
     
     def is_complex(self):
         """
         Returns true if the meter is complex (numerator 5, 7, 8, 10, 11, 13, or 14).
         """
-        return self.num in [5, 7, 8, 10, 11, 13, 14]
+        return self.num in {5, 7, 8, 10, 11, 13, 14}
 
     def is_duple(self):
         """
         Returns true if the meter is duple (numerator 2 or 6).
         """
-        return self.num in [2, 6]
+        return self.num in {2, 6}
 
     def is_triple(self):
         """
         Returns true if the meter is triple (numerator 3 or 9).
         """
-        return self.num in [3, 9]
+        return self.num in {3, 9}
 
     def is_quadruple(self):
         """
         Returns true if the meter is quadruple (numerator 4 or 12).
         """
-        return self.num in [4, 12]
+        return self.num in {4, 12}
     
     def is_quintuple(self):
         """
         Returns true if the meter is quintuple (numerator 5 or 15).
         """
-        return self.num in [5, 15]
+        return self.num in {5, 15}
 
     def is_septuple(self):
         """
         Returns true if the meter is a septuple (numerator 7).
         """
-        return self.num in [7]
+        return self.num == 7
 
     def beat(self):
         """
@@ -109,12 +129,16 @@ class Meter:
         example, 4/4 returns a beat of 1/4, 6/8 meter returns the beat 3/8,
         and 3/2 returns a beat of 1/2.
         """
-        if self.is_simple():
-            return Fraction(1, self.den)
-        elif self.is_compound():
-            return Fraction(1, self.den) * 3
-        else:
-            raise NotImplementedError('Ooops! Odd meter beats not implemented.')
+        beat = _beats.get((self.num, self.den))
+        if beat is None:
+            if self.is_simple():
+                beat = Fraction(1, self.den)
+            elif self.is_compound():
+                beat = Fraction(1, self.den) * 3
+            else:
+                raise NotImplementedError('Ooops! Odd meter beats not implemented.')
+            _beats[self.num, self.den] = beat
+        return beat
 
 
     def measure_dur(self):
@@ -123,5 +147,8 @@ class Meter:
         beats. For example, 4/4 returns a duration Fraction of 1/1, 6/8 meter
         returns 3/4, and 3/2 returns a duration of 3/2. See: Fraction.
         """
-        return Fraction(1, self.den) * self.num
+        dur = _measure_durs.get((self.num, self.den))
+        if dur is None:
+            dur = _measure_durs[self.num, self.den] = Fraction(1, self.den) * self.num
+        return dur
 
@@ -440,7 +440,7 @@ def _parse_attributes(elem, DATA):
             num = s.findtext('beats')
             den = s.findtext('beat-type')
             staff = int(s.get("number", "0")) # 0=all staffs
-            meter = Meter(int(num), int(den), staff)
+            meter = Meter._pooled(int(num), int(den), staff)
             #measure.meters.append(meter)
             measure.add_element(meter)
             DATA['meter'] = meter
@@ -451,7 +451,7 @@ def _parse_attributes(elem, DATA):
             mode = {'major': Mode.MAJOR, 'minor': Mode.MINOR, 'dorian': Mode.DORIAN, 'phrygian': Mode.PHRYGIAN, 
             'lydian': Mode.LYDIAN, 'mixolydian': Mode.MIXOLYDIAN, 'aeolian': Mode.AEOLIAN, 'ionian': Mode.IONIAN, 
             'locrian': Mode.LOCRIAN}[text]
-            key = Key(int(fifths), mode, staff)
+            key = Key._fast(int(fifths), mode, staff)
 #            measure.keys.append(key)
             measure.add_element(key)
             DATA['key'] = key
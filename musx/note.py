@@ -24,6 +24,9 @@ class Event:
         time and duration metrically, see `musx.rhythm.rhythm()` and
         `musx.rhythm.intempo()`.
     """
+    # Lets subclasses that declare __slots__ do without an instance __dict__.
+    __slots__ = ('_time',)
+
     def __init__(self, time):
         self.time = time
 
@@ -21,6 +21,7 @@ See the demos directory for many examples of part composers!
 """
 
 import types
+from collections import deque
 
 
 class Score:
@@ -33,9 +34,9 @@ class Score:
     running when it stops yielding delta times or it yields a negative delta time.
     """
 
-    _queue = []
+    _queue = deque()
     """
-    A time sorted list of queue entries. A queue entry is a list: 
+    A time sorted deque of queue entries. A queue entry is a list: 
     [<runtime>, <starttime>, <composer>], where <runtime> is the next time 
     (in seconds) at which <composer> will be called, <starttime> is 
     the time at which <composer> was initially inserted into the scheduer,
@@ -52,7 +53,7 @@ class Score:
 
 
     def _clean(self):
-        self._queue = []
+        self._queue = deque()
         self.running = False
         self._latest_time = self.now = self.elapsed = 0
 
@@ -140,7 +141,7 @@ class Score:
         self.running = True
         while len(self._queue) > 0:
             # Pop earliest entry from the queue and get its composer
-            entry = self._queue.pop(0)
+            entry = self._queue.popleft()
             # Set the current score time to the entry's time.
             self.now = entry[0]
             # print(f"before composer, score time is {self.now}")